@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+import bisect
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import random
 import sys
 from typing import (
@@ -38,6 +40,16 @@ ScoreAndSaverParser = Callable[[int, Optional[ScoreSaver]], None]
 
 class Round(Generator[None, str, None]):
 
+    __slots__ = (
+        "_secret_number",
+        "_number_params",
+        "_parse_hints",
+        "_parse_score_and_saver",
+        "_ranking_repo",
+        "_history",
+        "_closed",
+    )
+
     def __init__(
             self,
             number_params: NumberParams,
@@ -118,17 +130,21 @@ class Round(Generator[None, str, None]):
 
 def draw_number(number_params: NumberParams) -> str:
     return "".join(
-        random.sample(number_params.digits_set, number_params.number_size)
+        random.sample(number_params._digits_tuple, number_params.number_size)
     )
 
 
 def is_number_valid(number: str, number_params: NumberParams) -> bool:
-    try:
-        validate_number(number, number_params)
-    except ValueError:
-        return False
-    else:
-        return True
+    """Check number like `validate_number()` but without building error
+    message. Repeats its rules instead of wrapping it, because `Round`
+    asserts it on every guess. Keep both in sync.
+    """
+    digits = set(number)
+    return (
+        len(number) == number_params.number_size
+        and len(digits) == len(number)
+        and digits <= number_params.digits_set
+    )
 
 
 def validate_number(number: str, number_params: NumberParams) -> None:
@@ -217,6 +233,7 @@ class Digits:
 DigitsFactory = Callable[[int], Digits]
 
 
+@lru_cache(maxsize=None)
 def standard_digits(digits_num: int) -> Digits:
     DIGITS_SEQUENCE = "123456789abcdefghijklmnopqrstuvwxyz"
 
@@ -253,6 +270,7 @@ class NumberParams:
     digits_set: FrozenSet[str] = field(compare=False)
     digits_description: str = field(compare=False)
     label: str = field(compare=False, default="")
+    _digits_tuple: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.digits_num != len(self.digits_set):
@@ -260,6 +278,7 @@ class NumberParams:
                 f"`digits_num` ({self.digits_num}) is diffrent from length of"
                 f" `digits_set` ({len(self.digits_set)})"
             )
+        object.__setattr__(self, "_digits_tuple", tuple(sorted(self.digits_set)))
 
     @property
     def number_size(self) -> int:
@@ -280,6 +299,7 @@ class NumberParams:
         return cls(difficulty, digits.data, digits.description, label)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def standard(cls, difficulty: Difficulty, label: str = "") -> NumberParams:
         return cls.from_digits_factory(difficulty, standard_digits, label)
 
@@ -359,18 +379,20 @@ class RankingRepo(metaclass=ABCMeta):
             score_data: ScoreData,
             player: str,
     ) -> Ranking:
-        """Add new record to ranking. Save and return updated one."""
+        """Add new record to ranking. Save and return updated one.
+        If record do not fit into ranking return it unchanged.
+        """
         assert is_player_name_valid(player)
         ranking = self.load(score_data.difficulty)
-        new_data = list(ranking.data)
-        new_data.append(
-            RankingRecord(
-                score_data.score,
-                score_data.dt,
-                player,
-            ),
+        record = RankingRecord(
+            score_data.score,
+            score_data.dt,
+            player,
         )
-        new_data.sort()
+        if len(ranking.data) >= RANKING_SIZE and record >= ranking.data[-1]:
+            return ranking
+        new_data = list(ranking.data)
+        bisect.insort(new_data, record)
         return Ranking(tuple(new_data[:RANKING_SIZE]), ranking.difficulty)
 
     @abstractmethod
@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 import csv
 from datetime import datetime
+import os
 from pathlib import Path
-from typing import Final, Iterator
+from typing import Dict, Final, Iterator, Optional, Set, Tuple
 
 from bacpy.core import (
     Difficulty,
@@ -17,13 +20,38 @@ RANKINGS_DIR: Final[Path] = Path(".rankings")
 
 class FileRankingRepo(RankingRepo):
 
-    def __init__(self, rankings_dir: Path) -> None:
+    def __init__(self, rankings_dir: Path, *, write_behind: bool = False) -> None:
+        """If `write_behind` is set updated rankings are saved only by
+        `flush()` (also called on exiting context), not on every `update()`.
+        Flushing overwrites rankings saved meanwhile by other sessions.
+        """
         self._rankings_dir = rankings_dir
+        self._write_behind = write_behind
+        self._cache: Dict[Difficulty, Tuple[Tuple[int, int], Ranking]] = {}
+        self._dirty: Dict[Difficulty, Ranking] = {}
+        self._available: Optional[Set[Difficulty]] = None
+        self._paths: Dict[Difficulty, Path] = {}
+
+    def __enter__(self) -> FileRankingRepo:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
 
     def load(self, difficulty: Difficulty) -> Ranking:
-        path = self._get_path(difficulty)
-        path.touch()
-        with open(path, "r") as file:
+        if difficulty in self._dirty:
+            return self._dirty[difficulty]
+        stamp = self._get_stamp(difficulty)
+        cached = self._cache.get(difficulty)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        _, size = stamp
+        ranking = self._read(difficulty) if size else Ranking((), difficulty)
+        self._cache[difficulty] = (stamp, ranking)
+        return ranking
+
+    def _read(self, difficulty: Difficulty) -> Ranking:
+        with open(self._get_path(difficulty), "r", newline="") as file:
             return Ranking(
                 data=tuple(
                     RankingRecord(
@@ -41,27 +69,74 @@ class FileRankingRepo(RankingRepo):
             score_data: ScoreData,
             player: str,
     ) -> Ranking:
+        ranking = self.load(score_data.difficulty)
         updated_ranking = super().update(score_data, player)
-        self._save(updated_ranking)
+        if updated_ranking is ranking:
+            return ranking
+        if self._write_behind:
+            self._dirty[updated_ranking.difficulty] = updated_ranking
+        else:
+            self._save(updated_ranking)
+        if self._available is not None:
+            self._available.add(updated_ranking.difficulty)
         return updated_ranking
 
+    def flush(self) -> None:
+        """Save rankings updated since last flush."""
+        for difficulty, ranking in list(self._dirty.items()):
+            self._save(ranking)
+            del self._dirty[difficulty]
+
     def _save(
             self,
             ranking: Ranking,
     ) -> None:
         path = self._get_path(ranking.difficulty)
-        with open(path, "w") as file:
-            writer = csv.writer(file)
-            writer.writerows(ranking.data)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerows(ranking.data)
+                file.flush()
+                os.fsync(file.fileno())
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, path)
+        self._cache[ranking.difficulty] = (
+            self._get_stamp(ranking.difficulty),
+            ranking,
+        )
+
+    def _get_stamp(self, difficulty: Difficulty) -> Tuple[int, int]:
+        """Return modification time and size of ranking file, or zeros if it
+        does not exist.
+        """
+        try:
+            stat = self._get_path(difficulty).stat()
+        except FileNotFoundError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
 
     def _get_path(self, difficulty: Difficulty) -> Path:
-        return (
-            self._rankings_dir
-            / f"{difficulty.number_size}_{difficulty.digits_num}.csv"
-        )
+        if difficulty not in self._paths:
+            self._paths[difficulty] = (
+                self._rankings_dir
+                / f"{difficulty.number_size}_{difficulty.digits_num}.csv"
+            )
+        return self._paths[difficulty]
 
     def available_difficulties(self) -> Iterator[Difficulty]:
-        for path in self._rankings_dir.iterdir():
-            if path.stat().st_size:
-                number_size, digits_num = map(int, path.stem.split("_"))
-                yield Difficulty(number_size, digits_num)
+        if self._available is None:
+            self._available = self._scan_difficulties().union(self._dirty)
+        yield from tuple(self._available)
+
+    def _scan_difficulties(self) -> Set[Difficulty]:
+        difficulties = set()
+        with os.scandir(self._rankings_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext == ".csv" and entry.is_file() and entry.stat().st_size:
+                    number_size, digits_num = map(int, stem.split("_"))
+                    difficulties.add(Difficulty(number_size, digits_num))
+        return difficulties
@@ -1,3 +1,4 @@
+import bisect
 from typing import Dict, Iterator, List, Optional
 
 from bacpy.core import (
@@ -27,15 +28,15 @@ class MemoryRankingRepo(RankingRepo):
 
     def update(self, score_data: ScoreData, player: str) -> Ranking:
         assert is_player_name_valid(player)
-        self._data.setdefault(score_data.difficulty, []).append(
-            RankingRecord(
-                score_data.score,
-                score_data.dt,
-                player,
-            )
+        data = self._data.setdefault(score_data.difficulty, [])
+        record = RankingRecord(
+            score_data.score,
+            score_data.dt,
+            player,
         )
-        self._data[score_data.difficulty].sort()
-        del self._data[score_data.difficulty][RANKING_SIZE:]
+        if len(data) < RANKING_SIZE or record < data[-1]:
+            bisect.insort(data, record)
+            del data[RANKING_SIZE:]
         return self.load(score_data.difficulty)
 
     def available_difficulties(self) -> Iterator[Difficulty]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import overload, Sequence, TypeVar
+import sys
+from typing import Any, Iterator, overload, Sequence, TypeVar
 
 
 # Type variables
@@ -14,6 +15,8 @@ T_co = TypeVar("T_co", covariant=True)
 
 class SequenceView(Sequence[T_co]):
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: Sequence[T_co]) -> None:
         self._data = data
 
@@ -29,6 +32,26 @@ class SequenceView(Sequence[T_co]):
     def __len__(self) -> int:
         return len(self._data)
 
+    # Delegate to underlying sequence instead of `Sequence` mixin methods that
+    # iterate through `__getitem__`.
+
+    def __iter__(self) -> Iterator[T_co]:
+        return iter(self._data)
+
+    def __reversed__(self) -> Iterator[T_co]:
+        return reversed(self._data)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._data
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        if start == 0 and stop == sys.maxsize:
+            return self._data.index(value)
+        return super().index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        return self._data.count(value)
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, SequenceView):
             return self._data == other._data
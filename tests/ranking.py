@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import pytest
+
 from bacpy.core import (
     Difficulty,
     Ranking,
@@ -8,12 +10,38 @@ from bacpy.core import (
 )
 
 
+FULL_RANKING = Ranking(
+    (
+        RankingRecord(6, datetime(2021, 3, 17), "Tomasz"),
+        RankingRecord(8, datetime(2021, 2, 18), "Maciek"),
+        RankingRecord(10, datetime(2021, 6, 5), "Tomek"),
+        RankingRecord(15, datetime(2021, 6, 4), "Tomasz"),
+        RankingRecord(15, datetime(2021, 6, 6), "Zofia"),
+        RankingRecord(17, datetime(2021, 4, 5), "Piotrek"),
+        RankingRecord(20, datetime(2020, 12, 30), "Tomasz"),
+        RankingRecord(21, datetime(2021, 3, 20), "Tomasz"),
+        RankingRecord(30, datetime(2020, 11, 10), "Darek"),
+        RankingRecord(32, datetime(2020, 8, 1), "TO_DROP"),
+    ),
+    Difficulty(3, 6),
+)
+
+# Saved in reverse, so the repo has to sort them
+FULL_RANKING_RECORDS = tuple(reversed(FULL_RANKING.data))
+
+
 class BaseTest_RankingRepo:
     """Base test case for all `RankingRepo` subclasses` test cases.
     Passing that tests is necessary to be compatible with interface represented by
     superclass.
     """
 
+    @pytest.fixture
+    def full_ranking_repo(self, ranking_repo):
+        for score, dt, player in FULL_RANKING_RECORDS:
+            ranking_repo.update(ScoreData(score, dt, FULL_RANKING.difficulty), player)
+        return ranking_repo
+
     def test_FileRankingRepo_load__not_existing_ranking(self, ranking_repo):
         difficulty = Difficulty(4, 6)
         assert ranking_repo.load(difficulty) == Ranking((), difficulty)
@@ -34,28 +62,12 @@ class BaseTest_RankingRepo:
             ScoreData(16, datetime(2021, 6, 7), difficulty)
         )
 
-    def test_FileRankingRepo_is_score_fit_into__full(self, ranking_repo):
-        difficulty = Difficulty(3, 6)
-
-        for score_data, player in (
-                (ScoreData(6, datetime(2021, 3, 17), difficulty), "Tomasz"),
-                (ScoreData(8, datetime(2021, 2, 18), difficulty), "Maciek"),
-                (ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"),
-                (ScoreData(15, datetime(2021, 6, 4), difficulty), "Tomasz"),
-                (ScoreData(15, datetime(2021, 6, 6), difficulty), "Zofia"),
-                (ScoreData(17, datetime(2021, 4, 5), difficulty), "Piotrek"),
-                (ScoreData(20, datetime(2020, 12, 30), difficulty), "Tomasz"),
-                (ScoreData(21, datetime(2021, 3, 20), difficulty), "Tomasz"),
-                (ScoreData(30, datetime(2020, 11, 10), difficulty), "Darek"),
-                (ScoreData(32, datetime(2020, 8, 1), difficulty), "Tomasz"),
-        ):
-            ranking_repo.update(score_data, player)
-
-        assert ranking_repo.is_score_fit_into(
-            ScoreData(12, datetime(2021, 6, 6), difficulty)
+    def test_FileRankingRepo_is_score_fit_into__full(self, full_ranking_repo):
+        assert full_ranking_repo.is_score_fit_into(
+            ScoreData(12, datetime(2021, 6, 6), FULL_RANKING.difficulty)
         )
-        assert not ranking_repo.is_score_fit_into(
-            ScoreData(33, datetime(2021, 6, 6), difficulty)
+        assert not full_ranking_repo.is_score_fit_into(
+            ScoreData(33, datetime(2021, 6, 6), FULL_RANKING.difficulty)
         )
 
     def test_FileRankingRepo_update__not_full(self, ranking_repo):
@@ -80,80 +92,30 @@ class BaseTest_RankingRepo:
         assert updated_ranking == expected_ranking
         assert updated_ranking == ranking_repo.load(difficulty)
 
-    def test_FileRankingMamager_update__full(self, ranking_repo):
-        difficulty = Difficulty(3, 6)
-
-        for score_data, player in (
-                (ScoreData(32, datetime(2020, 8, 1), difficulty), "TO_DROP"),
-                (ScoreData(30, datetime(2020, 11, 10), difficulty), "Darek"),
-                (ScoreData(20, datetime(2020, 12, 30), difficulty), "Tomasz"),
-                (ScoreData(6, datetime(2021, 3, 17), difficulty), "Tomasz"),
-                (ScoreData(8, datetime(2021, 2, 18), difficulty), "Maciek"),
-                (ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"),
-                (ScoreData(15, datetime(2021, 6, 4), difficulty), "Tomasz"),
-                (ScoreData(15, datetime(2021, 6, 6), difficulty), "Zofia"),
-                (ScoreData(17, datetime(2021, 4, 5), difficulty), "Piotrek"),
-                (ScoreData(21, datetime(2021, 3, 20), difficulty), "Tomasz"),
-                (ScoreData(12, datetime(2021, 6, 6), difficulty), "NEWEST")
-        ):
-            updated_ranking = ranking_repo.update(score_data, player)
+    def test_FileRankingMamager_update__full(self, full_ranking_repo):
+        updated_ranking = full_ranking_repo.update(
+            ScoreData(12, datetime(2021, 6, 6), FULL_RANKING.difficulty), "NEWEST"
+        )
 
         expected_ranking = Ranking(
             (
-                RankingRecord(6, datetime(2021, 3, 17), "Tomasz"),
-                RankingRecord(8, datetime(2021, 2, 18), "Maciek"),
-                RankingRecord(10, datetime(2021, 6, 5), "Tomek"),
+                *FULL_RANKING.data[:3],
                 RankingRecord(12, datetime(2021, 6, 6), "NEWEST"),
-                RankingRecord(15, datetime(2021, 6, 4), "Tomasz"),
-                RankingRecord(15, datetime(2021, 6, 6), "Zofia"),
-                RankingRecord(17, datetime(2021, 4, 5), "Piotrek"),
-                RankingRecord(20, datetime(2020, 12, 30), "Tomasz"),
-                RankingRecord(21, datetime(2021, 3, 20), "Tomasz"),
-                RankingRecord(30, datetime(2020, 11, 10), "Darek"),
+                *FULL_RANKING.data[3:-1],
             ),
-            difficulty,
+            FULL_RANKING.difficulty,
         )
 
         assert updated_ranking == expected_ranking
-        assert updated_ranking == ranking_repo.load(difficulty)
-
-    def test_FileRankingRepo_update__overflow(self, ranking_repo):
-        difficulty = Difficulty(3, 6)
-
-        for score_data, player in (
-                (ScoreData(32, datetime(2020, 8, 1), difficulty), "Tomek"),
-                (ScoreData(30, datetime(2020, 11, 10), difficulty), "Darek"),
-                (ScoreData(20, datetime(2020, 12, 30), difficulty), "Tomasz"),
-                (ScoreData(6, datetime(2021, 3, 17), difficulty), "Tomasz"),
-                (ScoreData(8, datetime(2021, 2, 18), difficulty), "Maciek"),
-                (ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"),
-                (ScoreData(15, datetime(2021, 6, 4), difficulty), "Tomasz"),
-                (ScoreData(15, datetime(2021, 6, 6), difficulty), "Zofia"),
-                (ScoreData(17, datetime(2021, 4, 5), difficulty), "Piotrek"),
-                (ScoreData(21, datetime(2021, 3, 20), difficulty), "Tomasz"),
-                (ScoreData(35, datetime(2021, 6, 6), difficulty), "NEWEST")
-        ):
-            updated_ranking = ranking_repo.update(score_data, player)
+        assert updated_ranking == full_ranking_repo.load(FULL_RANKING.difficulty)
 
-        expected_ranking = Ranking(
-            (
-                RankingRecord(6, datetime(2021, 3, 17), "Tomasz"),
-                RankingRecord(8, datetime(2021, 2, 18), "Maciek"),
-                RankingRecord(10, datetime(2021, 6, 5), "Tomek"),
-                RankingRecord(15, datetime(2021, 6, 4), "Tomasz"),
-                RankingRecord(15, datetime(2021, 6, 6), "Zofia"),
-                RankingRecord(17, datetime(2021, 4, 5), "Piotrek"),
-                RankingRecord(20, datetime(2020, 12, 30), "Tomasz"),
-                RankingRecord(21, datetime(2021, 3, 20), "Tomasz"),
-                RankingRecord(30, datetime(2020, 11, 10), "Darek"),
-
-                RankingRecord(32, datetime(2020, 8, 1), "Tomek"),
-            ),
-            difficulty,
+    def test_FileRankingRepo_update__overflow(self, full_ranking_repo):
+        updated_ranking = full_ranking_repo.update(
+            ScoreData(35, datetime(2021, 6, 6), FULL_RANKING.difficulty), "NEWEST"
         )
 
-        assert updated_ranking == expected_ranking
-        assert updated_ranking == ranking_repo.load(difficulty)
+        assert updated_ranking == FULL_RANKING
+        assert updated_ranking == full_ranking_repo.load(FULL_RANKING.difficulty)
 
     def test_FileRankingRepo_available_difficulties(self, ranking_repo):
         difficulty1 = Difficulty(4, 8)
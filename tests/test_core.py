@@ -71,6 +71,10 @@ def test_standard_digits__raise_ValueError_on_invalid_digits_num(digits_num):
         standard_digits(digits_num)
 
 
+def test_standard_digits__return_cached_digits():
+    assert standard_digits(6) is standard_digits(6)
+
+
 # ============
 # Difficulties
 # ============
@@ -140,6 +144,13 @@ def test_NumberParams_standard():
     assert number_params.label == "some label"
 
 
+def test_NumberParams_standard__return_cached_number_params():
+    assert (
+        NumberParams.standard(Difficulty(3, 6), "label")
+        is NumberParams.standard(Difficulty(3, 6), "label")
+    )
+
+
 @pytest.mark.parametrize(
     "difficulty, digits, digits_description",
     (
@@ -157,6 +168,12 @@ def test_NumberParams__invalid_arguments(difficulty, digits, digits_description)
 # =====
 
 
+NUMBER_PARAMS_3_5 = NumberParams.standard(Difficulty(3, 5))
+NUMBER_PARAMS_3_6 = NumberParams.standard(Difficulty(3, 6))
+NUMBER_PARAMS_4_9 = NumberParams.standard(Difficulty(4, 9))
+NUMBER_PARAMS_5_15 = NumberParams.standard(Difficulty(5, 15))
+
+
 # is_number_valid
 # ---------------
 
@@ -164,9 +181,9 @@ def test_NumberParams__invalid_arguments(difficulty, digits, digits_description)
 @pytest.mark.parametrize(
     "number, number_params",
     (
-        ("163", NumberParams.standard(Difficulty(3, 6))),
-        ("1593", NumberParams.standard(Difficulty(4, 9))),
-        ("2f5a9", NumberParams.standard(Difficulty(5, 15))),
+        ("163", NUMBER_PARAMS_3_6),
+        ("1593", NUMBER_PARAMS_4_9),
+        ("2f5a9", NUMBER_PARAMS_5_15),
     )
 )
 def test_is_number_valid(number, number_params):
@@ -176,9 +193,9 @@ def test_is_number_valid(number, number_params):
 @pytest.mark.parametrize(
     "number, number_params",
     (
-        ("301", NumberParams.standard(Difficulty(3, 6))),
-        ("51a9", NumberParams.standard(Difficulty(4, 9))),
-        ("1g4a8", NumberParams.standard(Difficulty(5, 15))),
+        ("301", NUMBER_PARAMS_3_6),
+        ("51a9", NUMBER_PARAMS_4_9),
+        ("1g4a8", NUMBER_PARAMS_5_15),
     )
 )
 def test_is_number_valid__wrong_characters(number, number_params):
@@ -188,12 +205,12 @@ def test_is_number_valid__wrong_characters(number, number_params):
 @pytest.mark.parametrize(
     "number, number_params",
     (
-        ("1234", NumberParams.standard(Difficulty(3, 5))),
-        ("34", NumberParams.standard(Difficulty(3, 5))),
-        ("12349", NumberParams.standard(Difficulty(4, 9))),
-        ("31", NumberParams.standard(Difficulty(4, 9))),
-        ("12f3a49b", NumberParams.standard(Difficulty(5, 15))),
-        ("31d", NumberParams.standard(Difficulty(5, 15))),
+        ("1234", NUMBER_PARAMS_3_5),
+        ("34", NUMBER_PARAMS_3_5),
+        ("12349", NUMBER_PARAMS_4_9),
+        ("31", NUMBER_PARAMS_4_9),
+        ("12f3a49b", NUMBER_PARAMS_5_15),
+        ("31d", NUMBER_PARAMS_5_15),
     )
 )
 def test_is_number_valid__wrong_length(number, number_params):
@@ -203,9 +220,9 @@ def test_is_number_valid__wrong_length(number, number_params):
 @pytest.mark.parametrize(
     "number, number_params",
     (
-        ("232", NumberParams.standard(Difficulty(3, 5))),
-        ("3727", NumberParams.standard(Difficulty(4, 9))),
-        ("3b5b8", NumberParams.standard(Difficulty(5, 15))),
+        ("232", NUMBER_PARAMS_3_5),
+        ("3727", NUMBER_PARAMS_4_9),
+        ("3b5b8", NUMBER_PARAMS_5_15),
     )
 )
 def test_is_number_valid__not_unique_characters(number, number_params):
@@ -219,9 +236,9 @@ def test_is_number_valid__not_unique_characters(number, number_params):
 @pytest.mark.parametrize(
     "number_params",
     (
-        NumberParams.standard(Difficulty(3, 6)),
-        NumberParams.standard(Difficulty(4, 9)),
-        NumberParams.standard(Difficulty(5, 15)),
+        NUMBER_PARAMS_3_6,
+        NUMBER_PARAMS_4_9,
+        NUMBER_PARAMS_5_15,
     )
 )
 def test_draw_number(number_params):
@@ -1,7 +1,11 @@
+import csv
+from datetime import datetime
+
 import pytest
 
+from bacpy.core import Difficulty, Ranking, ScoreData
 from bacpy.file_ranking import FileRankingRepo
-from tests.ranking import BaseTest_RankingRepo
+from tests.ranking import BaseTest_RankingRepo, FULL_RANKING
 
 
 # TODO: test backward compatibility by snapshotting file
@@ -13,4 +17,157 @@ def ranking_repo(tmp_path):
 
 
 class Test_FileRankingRepo(BaseTest_RankingRepo):
-    pass
+
+    def test_FileRankingRepo_load__cache_ranking(self, ranking_repo):
+        difficulty = Difficulty(3, 6)
+        ranking = ranking_repo.load(difficulty)
+        assert ranking_repo.load(difficulty) is ranking
+
+    def test_FileRankingRepo_update__refresh_cached_ranking(self, ranking_repo, tmp_path):
+        difficulty = Difficulty(3, 6)
+        ranking_repo.load(difficulty)
+        updated_ranking = ranking_repo.update(
+            ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"
+        )
+        assert ranking_repo.load(difficulty) is updated_ranking
+        assert FileRankingRepo(tmp_path).load(difficulty) == updated_ranking
+
+    def test_FileRankingRepo_load__reload_changed_file(self, ranking_repo, tmp_path):
+        difficulty = Difficulty(3, 6)
+        ranking_repo.load(difficulty)
+        updated_ranking = FileRankingRepo(tmp_path).update(
+            ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"
+        )
+        assert ranking_repo.load(difficulty) == updated_ranking
+
+    def test_FileRankingRepo_update__keep_records_saved_by_other_repo(
+            self, ranking_repo, tmp_path
+    ):
+        difficulty = Difficulty(3, 6)
+        ranking_repo.load(difficulty)
+        FileRankingRepo(tmp_path).update(
+            ScoreData(5, datetime(2021, 6, 5), difficulty), "Bob"
+        )
+        ranking_repo.update(ScoreData(7, datetime(2021, 6, 6), difficulty), "Alice")
+        assert [
+            record.player for record in FileRankingRepo(tmp_path).load(difficulty).data
+        ] == ["Bob", "Alice"]
+
+    def test_FileRankingRepo_update__keep_cache_on_save_error(
+            self, ranking_repo, monkeypatch
+    ):
+        difficulty = Difficulty(3, 6)
+        ranking = ranking_repo.load(difficulty)
+        assert not list(ranking_repo.available_difficulties())
+
+        def failing_save(ranking):
+            raise OSError
+
+        monkeypatch.setattr(ranking_repo, "_save", failing_save)
+        with pytest.raises(OSError):
+            ranking_repo.update(ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek")
+
+        assert ranking_repo.load(difficulty) is ranking
+        assert not list(ranking_repo.available_difficulties())
+
+    def test_FileRankingRepo_update__do_not_save_not_fitting_score(
+            self, full_ranking_repo, monkeypatch
+    ):
+        saved = []
+        monkeypatch.setattr(full_ranking_repo, "_save", saved.append)
+
+        full_ranking_repo.update(
+            ScoreData(35, datetime(2021, 6, 6), FULL_RANKING.difficulty), "Tomek"
+        )
+        assert not saved
+
+    def test_FileRankingRepo_load__empty_file(self, ranking_repo, tmp_path):
+        (tmp_path / "3_6.csv").touch()
+        assert ranking_repo.load(Difficulty(3, 6)) == Ranking((), Difficulty(3, 6))
+
+    def test_FileRankingRepo_load__do_not_create_file(self, ranking_repo, tmp_path):
+        ranking_repo.load(Difficulty(3, 6))
+        assert not list(tmp_path.iterdir())
+
+    def test_FileRankingRepo_available_difficulties__include_later_updates(
+            self, ranking_repo
+    ):
+        difficulty1 = Difficulty(3, 6)
+        difficulty2 = Difficulty(4, 9)
+        ranking_repo.update(ScoreData(10, datetime(2021, 6, 5), difficulty1), "Tomek")
+        assert list(ranking_repo.available_difficulties()) == [difficulty1]
+
+        ranking_repo.update(ScoreData(10, datetime(2021, 6, 5), difficulty2), "Tomek")
+        assert (
+            sorted(ranking_repo.available_difficulties())
+            == [difficulty1, difficulty2]
+        )
+
+    def test_FileRankingRepo_update__replace_file(self, ranking_repo, tmp_path):
+        ranking_repo.update(
+            ScoreData(10, datetime(2021, 6, 5), Difficulty(3, 6)), "Tomek"
+        )
+        assert [path.name for path in tmp_path.iterdir()] == ["3_6.csv"]
+
+    def test_FileRankingRepo_update__remove_tmp_file_on_error(
+            self, ranking_repo, tmp_path, monkeypatch
+    ):
+        def failing_writer(file):
+            raise OSError
+
+        monkeypatch.setattr(csv, "writer", failing_writer)
+        with pytest.raises(OSError):
+            ranking_repo.update(
+                ScoreData(10, datetime(2021, 6, 5), Difficulty(3, 6)), "Tomek"
+            )
+        assert not list(tmp_path.iterdir())
+
+    def test_FileRankingRepo_available_difficulties__skip_not_ranking_files(
+            self, ranking_repo, tmp_path
+    ):
+        (tmp_path / "3_6.tmp").write_text("10,2021-06-05 00:00:00,Tomek\n")
+        assert not list(ranking_repo.available_difficulties())
+
+
+class Test_FileRankingRepo__write_behind(BaseTest_RankingRepo):
+
+    @pytest.fixture
+    def ranking_repo(self, tmp_path):
+        return FileRankingRepo(tmp_path, write_behind=True)
+
+    def test_FileRankingRepo_update__save_only_on_flush(self, ranking_repo, tmp_path):
+        difficulty = Difficulty(3, 6)
+        updated_ranking = ranking_repo.update(
+            ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"
+        )
+        assert FileRankingRepo(tmp_path).load(difficulty) == Ranking((), difficulty)
+
+        ranking_repo.flush()
+        assert FileRankingRepo(tmp_path).load(difficulty) == updated_ranking
+
+    def test_FileRankingRepo_context__flush_on_exit(self, ranking_repo, tmp_path):
+        difficulty = Difficulty(3, 6)
+        with ranking_repo:
+            updated_ranking = ranking_repo.update(
+                ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"
+            )
+        assert FileRankingRepo(tmp_path).load(difficulty) == updated_ranking
+
+    def test_FileRankingRepo_flush__keep_unsaved_on_error(
+            self, ranking_repo, tmp_path, monkeypatch
+    ):
+        difficulty = Difficulty(3, 6)
+        updated_ranking = ranking_repo.update(
+            ScoreData(10, datetime(2021, 6, 5), difficulty), "Tomek"
+        )
+
+        def failing_save(ranking):
+            raise OSError
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ranking_repo, "_save", failing_save)
+            with pytest.raises(OSError):
+                ranking_repo.flush()
+
+        ranking_repo.flush()
+        assert FileRankingRepo(tmp_path).load(difficulty) == updated_ranking
@@ -41,19 +41,13 @@ def test_sequence_view_slicing():
 def test_sequence_view_iter():
     lst = [1, 2, 3]
     sequence = SequenceView(lst)
-    assert all(
-        left == right
-        for left, right in zip(sequence, lst)
-    )
+    assert list(sequence) == lst
 
 
 def test_sequence_view_reversed():
     lst = [1, 2, 3]
     sequence = SequenceView(lst)
-    assert all(
-        left == right
-        for left, right in zip(reversed(sequence), reversed(lst))
-    )
+    assert list(reversed(sequence)) == list(reversed(lst))
 
 
 def test_sequence_view_bool():
@@ -68,6 +62,14 @@ def test_sequence_view_index():
         sequence.index(4)
 
 
+def test_sequence_view_index__start_stop():
+    sequence = SequenceView([1, 2, 3, 2, 2])
+    assert sequence.index(2, 2) == 3
+    assert sequence.index(2, -1) == 4
+    with pytest.raises(ValueError):
+        sequence.index(1, 1, 4)
+
+
 def test_sequence_view_count():
     sequence = SequenceView([1, 2, 3, 2, 2])
     assert sequence.count(1) == 1
@@ -101,6 +103,7 @@ def test_sequence_view_dynamic_view():
     lst = [1, 2, 3]
     sequence = SequenceView(lst)
     lst.append(object())
+    assert len(sequence) == len(lst)
     assert all(
         left is right
         for left, right in zip(sequence, lst)